@@ -1,278 +1,299 @@
 #!/usr/bin/env python3
+import hashlib
+import mmap
+import os
 import re
-import uuid
+import shutil
+from string import Template
 
-def generate_uuid():
-    """Generate a 24-character hex UUID similar to Xcode's format"""
-    return uuid.uuid4().hex[:24].upper()
+def file_contains(path, needle, chunk_size=64 * 1024):
+    """Scan a file in fixed-size chunks and stop at the first occurrence of needle"""
+    tail = b''
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            if (tail + chunk).find(needle) != -1:
+                return True
+            # Keep enough of the previous chunk to catch a match split across reads
+            tail = chunk[-(len(needle) - 1):]
+    return False
 
-# Read the project file
-project_path = "/Users/dev/Downloads/test/DevCam/DevCam.xcodeproj/project.pbxproj"
-with open(project_path, 'r') as f:
-    content = f.read()
-
-# Check if test target already exists
-if 'DevCamTests' in content:
-    print("Test target already exists!")
-    exit(0)
+def backup_file(path):
+    """Keep the current file at path.backup, hardlinking it instead of copying where possible"""
+    backup_path = f"{path}.backup"
+    if os.path.exists(backup_path):
+        os.replace(backup_path, f"{backup_path}.prev")
+    try:
+        # The project is replaced rather than rewritten in place, so the link
+        # keeps pointing at the original contents
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy(path, backup_path)
 
-# Generate UUIDs for new elements
-test_target_uuid = generate_uuid()
-test_product_uuid = generate_uuid()
-test_sources_uuid = generate_uuid()
-test_frameworks_uuid = generate_uuid()
-test_resources_uuid = generate_uuid()
-test_buildconfig_list_uuid = generate_uuid()
-test_debug_config_uuid = generate_uuid()
-test_release_config_uuid = generate_uuid()
-test_dependency_uuid = generate_uuid()
-test_target_dependency_uuid = generate_uuid()
-test_group_uuid = generate_uuid()
+def closing_line(content, header, opener, closer):
+    """Return the offset of the line closing the opener block that follows header, or -1"""
+    start = content.find(header)
+    if start != -1:
+        start = content.find(opener, start)
+    if start == -1:
+        return -1
+    # The closing line is the next one indented like the opener's line
+    indent = content[content.rfind(b'\n', 0, start) + 1:start]
+    end = content.find(b'\n' + indent + closer, start)
+    return end + 1 if end != -1 else -1
 
-# 1. Add test product to PBXFileReference section
-file_ref_section = re.search(r'/\* Begin PBXFileReference section \*/\n(.*?)\n/\* End PBXFileReference section \*/', content, re.DOTALL)
-if file_ref_section:
-    new_file_ref = f'\t\t{test_product_uuid} /* DevCamTests.xctest */ = {{isa = PBXFileReference; explicitFileType = wrapper.cfbundle; includeInIndex = 0; path = DevCamTests.xctest; sourceTree = BUILT_PRODUCTS_DIR; }};\n'
-    content = content.replace(
-        '/* End PBXFileReference section */',
-        new_file_ref + '/* End PBXFileReference section */'
-    )
+# Patterns and markers used to locate insertion points in the project file
+SECTION_MARKER_RE = re.compile(
+    rb'/\* ((?:Begin|End) (?:PBXContainerItemProxy|PBXFileReference|PBXFileSystemSynchronizedRootGroup'
+    rb'|PBXFrameworksBuildPhase|PBXNativeTarget|PBXResourcesBuildPhase|PBXSourcesBuildPhase'
+    rb'|PBXTargetDependency|XCBuildConfiguration|XCConfigurationList)) section \*/'
+)
+PRODUCTS_GROUP = b'D76E4B1F2F2331380090999D /* Products */ = {'
+MAIN_GROUP = b'D76E4B152F2331380090999D = {'
 
-# 2. Add test group to PBXFileSystemSynchronizedRootGroup section
-fs_sync_section = re.search(r'/\* End PBXFileSystemSynchronizedRootGroup section \*/', content)
-if fs_sync_section:
-    new_group = f'''\t\t{test_group_uuid} /* DevCamTests */ = {{
+# Snippets inserted into the project file, filled in with the new object IDs
+FILE_REF_TMPL = Template('\t\t$product /* DevCamTests.xctest */ = {isa = PBXFileReference; explicitFileType = wrapper.cfbundle; includeInIndex = 0; path = DevCamTests.xctest; sourceTree = BUILT_PRODUCTS_DIR; };\n')
+SYNC_GROUP_TMPL = Template('''\t\t$group /* DevCamTests */ = {
 \t\t\tisa = PBXFileSystemSynchronizedRootGroup;
 \t\t\tpath = DevCamTests;
 \t\t\tsourceTree = "<group>";
-\t\t}};
-'''
-    content = content.replace(
-        '/* End PBXFileSystemSynchronizedRootGroup section */',
-        new_group + '/* End PBXFileSystemSynchronizedRootGroup section */'
-    )
-
-# 3. Add frameworks build phase
-frameworks_section = re.search(r'/\* End PBXFrameworksBuildPhase section \*/', content)
-if frameworks_section:
-    new_frameworks = f'''\t\t{test_frameworks_uuid} /* Frameworks */ = {{
+\t\t};
+''')
+FRAMEWORKS_PHASE_TMPL = Template('''\t\t$frameworks /* Frameworks */ = {
 \t\t\tisa = PBXFrameworksBuildPhase;
 \t\t\tbuildActionMask = 2147483647;
 \t\t\tfiles = (
 \t\t\t);
 \t\t\trunOnlyForDeploymentPostprocessing = 0;
-\t\t}};
-'''
-    content = content.replace(
-        '/* End PBXFrameworksBuildPhase section */',
-        new_frameworks + '/* End PBXFrameworksBuildPhase section */'
-    )
-
-# 4. Add test product to Products group
-products_group = re.search(r'(D76E4B1F2F2331380090999D /\* Products \*/ = \{.*?children = \(\s*)(.*?)(\s*\);)', content, re.DOTALL)
-if products_group:
-    existing_children = products_group.group(2)
-    new_children = existing_children + f'\t\t\t\t{test_product_uuid} /* DevCamTests.xctest */,\n'
-    content = content.replace(
-        products_group.group(0),
-        products_group.group(1) + new_children + products_group.group(3)
-    )
-
-# 5. Add test group to main group
-main_group = re.search(r'(D76E4B152F2331380090999D = \{.*?children = \(\s*)(.*?)(\s*\);)', content, re.DOTALL)
-if main_group:
-    existing_children = main_group.group(2)
-    new_children = existing_children + f'\t\t\t\t{test_group_uuid} /* DevCamTests */,\n'
-    content = content.replace(
-        main_group.group(0),
-        main_group.group(1) + new_children + main_group.group(3)
-    )
-
-# 6. Add test target to PBXNativeTarget section
-native_target_section = re.search(r'/\* End PBXNativeTarget section \*/', content)
-if native_target_section:
-    new_target = f'''\t\t{test_target_uuid} /* DevCamTests */ = {{
+\t\t};
+''')
+PRODUCT_CHILD_TMPL = Template('\t\t\t\t$product /* DevCamTests.xctest */,\n')
+GROUP_CHILD_TMPL = Template('\t\t\t\t$group /* DevCamTests */,\n')
+NATIVE_TARGET_TMPL = Template('''\t\t$target /* DevCamTests */ = {
 \t\t\tisa = PBXNativeTarget;
-\t\t\tbuildConfigurationList = {test_buildconfig_list_uuid} /* Build configuration list for PBXNativeTarget "DevCamTests" */;
+\t\t\tbuildConfigurationList = $buildconfig_list /* Build configuration list for PBXNativeTarget "DevCamTests" */;
 \t\t\tbuildPhases = (
-\t\t\t\t{test_sources_uuid} /* Sources */,
-\t\t\t\t{test_frameworks_uuid} /* Frameworks */,
-\t\t\t\t{test_resources_uuid} /* Resources */,
+\t\t\t\t$sources /* Sources */,
+\t\t\t\t$frameworks /* Frameworks */,
+\t\t\t\t$resources /* Resources */,
 \t\t\t);
 \t\t\tbuildRules = (
 \t\t\t);
 \t\t\tdependencies = (
-\t\t\t\t{test_dependency_uuid} /* PBXTargetDependency */,
+\t\t\t\t$dependency /* PBXTargetDependency */,
 \t\t\t);
 \t\t\tfileSystemSynchronizedGroups = (
-\t\t\t\t{test_group_uuid} /* DevCamTests */,
+\t\t\t\t$group /* DevCamTests */,
 \t\t\t);
 \t\t\tname = DevCamTests;
 \t\t\tpackageProductDependencies = (
 \t\t\t);
 \t\t\tproductName = DevCamTests;
-\t\t\tproductReference = {test_product_uuid} /* DevCamTests.xctest */;
+\t\t\tproductReference = $product /* DevCamTests.xctest */;
 \t\t\tproductType = "com.apple.product-type.bundle.unit-test";
-\t\t}};
-'''
-    content = content.replace(
-        '/* End PBXNativeTarget section */',
-        new_target + '/* End PBXNativeTarget section */'
-    )
-
-# 7. Add PBXContainerItemProxy section if it doesn't exist
-if '/* Begin PBXContainerItemProxy section */' not in content:
-    container_proxy = f'''/* Begin PBXContainerItemProxy section */
-\t\t{test_target_dependency_uuid} /* PBXContainerItemProxy */ = {{
+\t\t};
+''')
+CONTAINER_PROXY_TMPL = Template('''/* Begin PBXContainerItemProxy section */
+\t\t$target_dependency /* PBXContainerItemProxy */ = {
 \t\t\tisa = PBXContainerItemProxy;
 \t\t\tcontainerPortal = D76E4B162F2331380090999D /* Project object */;
 \t\t\tproxyType = 1;
 \t\t\tremoteGlobalIDString = D76E4B1D2F2331380090999D;
 \t\t\tremoteInfo = DevCam;
-\t\t}};
+\t\t};
 /* End PBXContainerItemProxy section */
 
-'''
-    content = content.replace(
-        '/* Begin PBXFileReference section */',
-        container_proxy + '/* Begin PBXFileReference section */'
-    )
-
-# 8. Add PBXTargetDependency section if it doesn't exist
-if '/* Begin PBXTargetDependency section */' not in content:
-    target_dependency = f'''/* Begin PBXTargetDependency section */
-\t\t{test_dependency_uuid} /* PBXTargetDependency */ = {{
+''')
+TARGET_DEPENDENCY_TMPL = Template('''/* Begin PBXTargetDependency section */
+\t\t$dependency /* PBXTargetDependency */ = {
 \t\t\tisa = PBXTargetDependency;
 \t\t\ttarget = D76E4B1D2F2331380090999D /* DevCam */;
-\t\t\ttargetProxy = {test_target_dependency_uuid} /* PBXContainerItemProxy */;
-\t\t}};
+\t\t\ttargetProxy = $target_dependency /* PBXContainerItemProxy */;
+\t\t};
 /* End PBXTargetDependency section */
 
-'''
-    content = content.replace(
-        '/* Begin PBXFrameworksBuildPhase section */',
-        target_dependency + '/* Begin PBXFrameworksBuildPhase section */'
-    )
-
-# 9. Add test target to project targets list
-targets_list = re.search(r'(targets = \(\s*)(.*?)(\s*\);)', content, re.DOTALL)
-if targets_list:
-    existing_targets = targets_list.group(2)
-    new_targets = existing_targets + f'\t\t\t\t{test_target_uuid} /* DevCamTests */,\n'
-    content = content.replace(
-        targets_list.group(0),
-        targets_list.group(1) + new_targets + targets_list.group(3)
-    )
-
-# 10. Add test target attributes
-target_attrs = re.search(r'(TargetAttributes = \{)(.*?)(\s*\};)', content, re.DOTALL)
-if target_attrs:
-    existing_attrs = target_attrs.group(2)
-    new_attrs = existing_attrs + f'''
-\t\t\t\t\t{test_target_uuid} = {{
+''')
+TARGET_CHILD_TMPL = Template('\t\t\t\t$target /* DevCamTests */,\n')
+TARGET_ATTRS_TMPL = Template('''\t\t\t\t\t$target = {
 \t\t\t\t\t\tCreatedOnToolsVersion = 26.2;
 \t\t\t\t\t\tTestTargetID = D76E4B1D2F2331380090999D;
-\t\t\t\t\t}};'''
-    content = content.replace(
-        target_attrs.group(0),
-        target_attrs.group(1) + new_attrs + target_attrs.group(3)
-    )
-
-# 11. Add Resources build phase
-resources_section = re.search(r'/\* End PBXResourcesBuildPhase section \*/', content)
-if resources_section:
-    new_resources = f'''\t\t{test_resources_uuid} /* Resources */ = {{
+\t\t\t\t\t};
+''')
+RESOURCES_PHASE_TMPL = Template('''\t\t$resources /* Resources */ = {
 \t\t\tisa = PBXResourcesBuildPhase;
 \t\t\tbuildActionMask = 2147483647;
 \t\t\tfiles = (
 \t\t\t);
 \t\t\trunOnlyForDeploymentPostprocessing = 0;
-\t\t}};
-'''
-    content = content.replace(
-        '/* End PBXResourcesBuildPhase section */',
-        new_resources + '/* End PBXResourcesBuildPhase section */'
-    )
-
-# 12. Add Sources build phase
-sources_section = re.search(r'/\* End PBXSourcesBuildPhase section \*/', content)
-if sources_section:
-    new_sources = f'''\t\t{test_sources_uuid} /* Sources */ = {{
+\t\t};
+''')
+SOURCES_PHASE_TMPL = Template('''\t\t$sources /* Sources */ = {
 \t\t\tisa = PBXSourcesBuildPhase;
 \t\t\tbuildActionMask = 2147483647;
 \t\t\tfiles = (
 \t\t\t);
 \t\t\trunOnlyForDeploymentPostprocessing = 0;
-\t\t}};
-'''
-    content = content.replace(
-        '/* End PBXSourcesBuildPhase section */',
-        new_sources + '/* End PBXSourcesBuildPhase section */'
-    )
-
-# 13. Add build configurations for test target
-build_config_section = re.search(r'/\* End XCBuildConfiguration section \*/', content)
-if build_config_section:
-    new_debug_config = f'''\t\t{test_debug_config_uuid} /* Debug */ = {{
+\t\t};
+''')
+BUILD_CONFIG_TMPL = Template('''\t\t$config /* $name */ = {
 \t\t\tisa = XCBuildConfiguration;
-\t\t\tbuildSettings = {{
-\t\t\t\tBUNDLE_LOADER = "$(TEST_HOST)";
+\t\t\tbuildSettings = {
+\t\t\t\tBUNDLE_LOADER = "$$(TEST_HOST)";
 \t\t\t\tCODE_SIGN_STYLE = Automatic;
 \t\t\t\tCURRENT_PROJECT_VERSION = 1;
 \t\t\t\tDEVELOPMENT_TEAM = 93QQU293YD;
 \t\t\t\tGENERATE_INFOPLIST_FILE = YES;
 \t\t\t\tMARKETING_VERSION = 1.0;
 \t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = "Jonathan-Hines-Dumitru.DevCamTests";
-\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
+\t\t\t\tPRODUCT_NAME = "$$(TARGET_NAME)";
 \t\t\t\tSWIFT_EMIT_LOC_STRINGS = NO;
 \t\t\t\tSWIFT_VERSION = 5.0;
-\t\t\t\tTEST_HOST = "$(BUILT_PRODUCTS_DIR)/DevCam.app/$(BUNDLE_EXECUTABLE_FOLDER_PATH)/DevCam";
-\t\t\t}};
-\t\t\tname = Debug;
-\t\t}};
-\t\t{test_release_config_uuid} /* Release */ = {{
-\t\t\tisa = XCBuildConfiguration;
-\t\t\tbuildSettings = {{
-\t\t\t\tBUNDLE_LOADER = "$(TEST_HOST)";
-\t\t\t\tCODE_SIGN_STYLE = Automatic;
-\t\t\t\tCURRENT_PROJECT_VERSION = 1;
-\t\t\t\tDEVELOPMENT_TEAM = 93QQU293YD;
-\t\t\t\tGENERATE_INFOPLIST_FILE = YES;
-\t\t\t\tMARKETING_VERSION = 1.0;
-\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = "Jonathan-Hines-Dumitru.DevCamTests";
-\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
-\t\t\t\tSWIFT_EMIT_LOC_STRINGS = NO;
-\t\t\t\tSWIFT_VERSION = 5.0;
-\t\t\t\tTEST_HOST = "$(BUILT_PRODUCTS_DIR)/DevCam.app/$(BUNDLE_EXECUTABLE_FOLDER_PATH)/DevCam";
-\t\t\t}};
-\t\t\tname = Release;
-\t\t}};
-'''
-    content = content.replace(
-        '/* End XCBuildConfiguration section */',
-        new_debug_config + '/* End XCBuildConfiguration section */'
-    )
-
-# 14. Add build configuration list for test target
-config_list_section = re.search(r'/\* End XCConfigurationList section \*/', content)
-if config_list_section:
-    new_config_list = f'''\t\t{test_buildconfig_list_uuid} /* Build configuration list for PBXNativeTarget "DevCamTests" */ = {{
+\t\t\t\tTEST_HOST = "$$(BUILT_PRODUCTS_DIR)/DevCam.app/$$(BUNDLE_EXECUTABLE_FOLDER_PATH)/DevCam";
+\t\t\t};
+\t\t\tname = $name;
+\t\t};
+''')
+CONFIG_LIST_TMPL = Template('''\t\t$buildconfig_list /* Build configuration list for PBXNativeTarget "DevCamTests" */ = {
 \t\t\tisa = XCConfigurationList;
 \t\t\tbuildConfigurations = (
-\t\t\t\t{test_debug_config_uuid} /* Debug */,
-\t\t\t\t{test_release_config_uuid} /* Release */,
+\t\t\t\t$debug_config /* Debug */,
+\t\t\t\t$release_config /* Release */,
 \t\t\t);
 \t\t\tdefaultConfigurationIsVisible = 0;
 \t\t\tdefaultConfigurationName = Release;
-\t\t}};
-'''
-    content = content.replace(
-        '/* End XCConfigurationList section */',
-        new_config_list + '/* End XCConfigurationList section */'
+\t\t};
+''')
+
+# Project file to modify
+project_path = "/Users/dev/Downloads/test/DevCam/DevCam.xcodeproj/project.pbxproj"
+
+# Check if test target already exists
+if file_contains(project_path, b'DevCamTests'):
+    print("Test target already exists!")
+    exit(0)
+
+# Map the file read-only and search it as bytes, so the project is never
+# decoded into a str or copied into memory as a whole
+with open(project_path, 'rb') as f:
+    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+# Record every section marker in one sweep. Edits below only queue
+# (offset, snippet) insertions against the original content; the file is
+# assembled once at the end instead of being copied on every step.
+sections = {m.group(1).decode(): m.start() for m in SECTION_MARKER_RE.finditer(content)}
+insertions = []
+
+# Generate UUIDs for new elements in Xcode's 24-character hex format. They are
+# hashed from the project path and each object's role rather than random, so
+# re-running the script yields the same IDs and doesn't churn the project.
+# Every snippet is filled in from this one mapping.
+ids = {
+    role: hashlib.sha256(f"{project_path}:test_{role}".encode()).hexdigest()[:24].upper()
+    for role in (
+        'target',
+        'product',
+        'sources',
+        'frameworks',
+        'resources',
+        'buildconfig_list',
+        'debug_config',
+        'release_config',
+        'dependency',
+        'target_dependency',
+        'group',
     )
+}
+
+# 1. Add test product to PBXFileReference section
+if 'End PBXFileReference' in sections:
+    new_file_ref = FILE_REF_TMPL.substitute(ids)
+    insertions.append((sections['End PBXFileReference'], new_file_ref))
+
+# 2. Add test group to PBXFileSystemSynchronizedRootGroup section
+if 'End PBXFileSystemSynchronizedRootGroup' in sections:
+    new_group = SYNC_GROUP_TMPL.substitute(ids)
+    insertions.append((sections['End PBXFileSystemSynchronizedRootGroup'], new_group))
+
+# 3. Add frameworks build phase
+if 'End PBXFrameworksBuildPhase' in sections:
+    new_frameworks = FRAMEWORKS_PHASE_TMPL.substitute(ids)
+    insertions.append((sections['End PBXFrameworksBuildPhase'], new_frameworks))
+
+# 4. Add test product to Products group
+products_children_end = closing_line(content, PRODUCTS_GROUP, b'children = (', b');')
+if products_children_end != -1:
+    new_child = PRODUCT_CHILD_TMPL.substitute(ids)
+    insertions.append((products_children_end, new_child))
+
+# 5. Add test group to main group
+main_children_end = closing_line(content, MAIN_GROUP, b'children = (', b');')
+if main_children_end != -1:
+    new_child = GROUP_CHILD_TMPL.substitute(ids)
+    insertions.append((main_children_end, new_child))
+
+# 6. Add test target to PBXNativeTarget section
+if 'End PBXNativeTarget' in sections:
+    new_target = NATIVE_TARGET_TMPL.substitute(ids)
+    insertions.append((sections['End PBXNativeTarget'], new_target))
+
+# 7. Add PBXContainerItemProxy section if it doesn't exist
+if 'Begin PBXContainerItemProxy' not in sections and 'Begin PBXFileReference' in sections:
+    container_proxy = CONTAINER_PROXY_TMPL.substitute(ids)
+    insertions.append((sections['Begin PBXFileReference'], container_proxy))
+
+# 8. Add PBXTargetDependency section if it doesn't exist
+if 'Begin PBXTargetDependency' not in sections and 'Begin PBXFrameworksBuildPhase' in sections:
+    target_dependency = TARGET_DEPENDENCY_TMPL.substitute(ids)
+    insertions.append((sections['Begin PBXFrameworksBuildPhase'], target_dependency))
+
+# 9. Add test target to project targets list
+targets_end = closing_line(content, b'targets = (', b'targets = (', b');')
+if targets_end != -1:
+    new_target_ref = TARGET_CHILD_TMPL.substitute(ids)
+    insertions.append((targets_end, new_target_ref))
+
+# 10. Add test target attributes
+target_attrs_end = closing_line(content, b'TargetAttributes = {', b'TargetAttributes = {', b'};')
+if target_attrs_end != -1:
+    new_attrs = TARGET_ATTRS_TMPL.substitute(ids)
+    insertions.append((target_attrs_end, new_attrs))
+
+# 11. Add Resources build phase
+if 'End PBXResourcesBuildPhase' in sections:
+    new_resources = RESOURCES_PHASE_TMPL.substitute(ids)
+    insertions.append((sections['End PBXResourcesBuildPhase'], new_resources))
+
+# 12. Add Sources build phase
+if 'End PBXSourcesBuildPhase' in sections:
+    new_sources = SOURCES_PHASE_TMPL.substitute(ids)
+    insertions.append((sections['End PBXSourcesBuildPhase'], new_sources))
+
+# 13. Add build configurations for test target
+if 'End XCBuildConfiguration' in sections:
+    new_build_configs = (
+        BUILD_CONFIG_TMPL.substitute(ids, config=ids['debug_config'], name='Debug')
+        + BUILD_CONFIG_TMPL.substitute(ids, config=ids['release_config'], name='Release')
+    )
+    insertions.append((sections['End XCBuildConfiguration'], new_build_configs))
+
+# 14. Add build configuration list for test target
+if 'End XCConfigurationList' in sections:
+    new_config_list = CONFIG_LIST_TMPL.substitute(ids)
+    insertions.append((sections['End XCConfigurationList'], new_config_list))
 
-# Write the modified content back
-with open(project_path, 'w') as f:
-    f.write(content)
+# Stream the original content and the queued snippets straight into a
+# temporary file in a single forward pass, then swap it in, so the output is
+# never assembled in memory and an interrupted write never leaves a
+# truncated project behind
+backup_file(project_path)
+tmp_path = f"{project_path}.tmp"
+with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+    prev = 0
+    for offset, snippet in sorted(insertions, key=lambda insertion: insertion[0]):
+        f.write(content[prev:offset])
+        f.write(snippet.encode())
+        prev = offset
+    f.write(content[prev:])
+content.close()
+os.replace(tmp_path, project_path)
 
 print("Successfully added DevCamTests target to Xcode project!")